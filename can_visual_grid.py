@@ -6,13 +6,73 @@ Toggle between HEX and ASCII display to find Ford's ASCII-encoded values
 Click on cells to select up to 2 for combined analysis
 """
 
+import numpy as np
 import pygame
 import serial
 import threading
 import time
 import argparse
+from collections import deque
+import functools
+import re
 import sys
-from collections import defaultdict
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional, get_window_colors falls back to NumPy
+    njit = None
+
+# Every 0x-prefixed field in a logger CSV line: CAN ID first, then the data bytes
+_HEX_RE = re.compile(rb'0x([0-9A-Fa-f]+)')
+
+# Two-digit hex text -> byte value, avoids int(..., 16) per byte
+_HEX_LUT = {b'%02X' % i: i for i in range(256)}
+_HEX_LUT.update({b'%02x' % i: i for i in range(256)})
+
+# Byte value -> two-digit hex text, with and without the 0x prefix
+_HEX_TBL = tuple(f"{b:02X}" for b in range(256))
+_HEX0X_TBL = tuple("0x" + h for h in _HEX_TBL)
+
+# Byte value -> display character, printable ASCII as-is and '.' for everything else
+_ASCII_LUT = bytes(b if 32 <= b <= 126 else 0x2E for b in range(256)).decode('latin1')
+
+# Change age bands: bright green, green, yellow, fading back to white, white
+_AGE_BANDS = (0.5, 1.0, 2.0, 5.0)
+_FADE_BAND = 3
+_FADE_STEPS = 32  # Yellow -> white fade is quantized, so fading cells only repaint 32 times
+
+def _fill_window_colors(change_times, values, now, ascii_mode, band_palette, fade_palette, out):
+    """Fill out[row, byte] with the age/ASCII color of each cell - the reference cell color rules
+    
+    In ASCII mode printable bytes are bright green for 2 s after a change, light green otherwise.
+    Other cells go by change age: bright green, green, yellow, a yellow -> white fade from 2 s to
+    5 s, then white; cells that never changed are white. Selection colors are applied on top by
+    get_window_colors, whose NumPy fallback must follow the same rules.
+    
+    band_palette rows are the age band colors followed by LIGHT_GREEN for printable ASCII
+    """
+    for row in range(change_times.shape[0]):
+        for col in range(change_times.shape[1]):
+            change_time = change_times[row, col]
+            age = now - change_time
+            
+            if ascii_mode and 32 <= values[row, col] <= 126:
+                color = band_palette[0] if change_time > 0 and age < 2.0 else band_palette[5]
+            elif change_time == 0:
+                color = band_palette[4]
+            else:
+                band = int(age >= 0.5) + int(age >= 1.0) + int(age >= 2.0) + int(age >= 5.0)
+                if band == _FADE_BAND:
+                    color = fade_palette[min(_FADE_STEPS - 1, int((age - 2.0) * _FADE_STEPS / 3.0))]
+                else:
+                    color = band_palette[band]
+            
+            out[row, col, 0] = color[0]
+            out[row, col, 1] = color[1]
+            out[row, col, 2] = color[2]
+
+if njit is not None:
+    _fill_window_colors = njit(cache=True, nogil=True)(_fill_window_colors)
 
 class CANVisualGrid:
     def __init__(self, port, baud_rate=115200):
@@ -21,12 +81,10 @@ class CANVisualGrid:
         self.serial = None
         self.running = False
         
-        # Pygame setup - use more screen space
-        pygame.init()
+        # Window size - pygame itself is only initialized by start_ui()
         self.WINDOW_WIDTH = 1600  # Increased width
         self.WINDOW_HEIGHT = 900
-        self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        pygame.display.set_caption("🌡️ F150 CAN Bus Visual Monitor - ASCII/HEX Explorer")
+        self.screen = None
         
         # Grid settings - bigger cells
         self.CELL_WIDTH = 80  # Increased from 60
@@ -55,17 +113,19 @@ class CANVisualGrid:
         self.CYAN = (0, 255, 255)
         self.LIGHT_GREEN = (144, 238, 144)
         
-        # Fonts - bigger fonts for better readability
-        self.small_font = pygame.font.Font(None, 16)
-        self.tiny_font = pygame.font.Font(None, 14)
-        self.header_font = pygame.font.Font(None, 18)
-        self.info_font = pygame.font.Font(None, 16)
-        self.big_font = pygame.font.Font(None, 20)
-        
-        # Data storage
-        self.pid_list = []  # Ordered list of PIDs as they appear
-        self.current_values = defaultdict(lambda: [0] * 8)  # [pid] = [byte0, byte1, ..., byte7]
-        self.change_times = defaultdict(lambda: [0] * 8)    # [pid] = [time_byte0_changed, ...]
+        # Cell color lookup tables, indexed by age band / fade step (the fade band itself is a placeholder)
+        self._band_palette = np.array((self.BRIGHT_GREEN, self.GREEN, self.YELLOW, self.WHITE, self.WHITE,
+                                       self.LIGHT_GREEN), dtype=np.uint8)
+        self._fade_palette = np.array([(255, 255, 255 * step // (_FADE_STEPS - 1)) for step in range(_FADE_STEPS)],
+                                      dtype=np.uint8)
+        
+        # Data storage - one row per PID, grown on demand
+        self.pid_list = []  # Ordered list of PIDs (int CAN IDs) as they appear
+        self.pid_row = {}   # [pid] = row index into the arrays below
+        self._pid_label = {}  # [pid] = display string, e.g. "0x3C4"
+        self.current_values = np.zeros((256, 8), dtype=np.uint8)   # [row, byte] = value
+        self.change_times = np.zeros((256, 8), dtype=np.float64)   # [row, byte] = time last changed
+        self._payloads = []  # [row] = last payload bytes, serial thread only
         self.total_messages = 0
         self.messages_per_second = 0
         self.last_fps_time = time.time()
@@ -76,17 +136,83 @@ class CANVisualGrid:
         self.max_visible_rows = (self.WINDOW_HEIGHT - self.START_Y - 150) // self.CELL_HEIGHT  # Leave more space for info panel
         
         # Multi-cell inspector - can select up to 2 cells
-        self.selected_cells = []  # List of (pid, byte_index) tuples, max 2
+        self.selected_cells = deque(maxlen=2)  # (pid, byte_index) tuples, appending a third drops the oldest
         self.info_panel_height = 120  # Increased height for more info
         
+        # Dirty-rect redraw state - what each visible cell currently shows on screen
+        self._full_redraw = True
+        self._last_stats = None
+        self._panel_lines = None
+        self._dirty_evt = threading.Event()  # Set by the serial thread when any byte changes
+        self._seq = 0  # Payload stores so far, only the serial thread bumps it
+        self._drawn_seq = -1  # _seq the painted values were taken at
+        self._last_draw_time = 0
+        self._painted_colors = np.zeros((self.max_visible_rows, 8, 3), dtype=np.uint8)
+        self._painted_values = np.zeros((self.max_visible_rows, 8), dtype=np.uint8)
+        
+        # Screen rect of every visible cell, [row_idx][byte] - the grid never moves
+        self._cell_rects = [[pygame.Rect(self.START_X + col * self.CELL_WIDTH, self.START_Y + row_idx * self.CELL_HEIGHT,
+                                         self.CELL_WIDTH, self.CELL_HEIGHT) for col in range(8)]
+                            for row_idx in range(self.max_visible_rows)]
+        
+        self._bg_key = None
+        
         # Temperature calibration logging
         self.calibration_mode = False
         self.calibration_data = []  # List of (actual_temp, combined_value, timestamp)
+        self._last_logged_combined = None
         
+        # Console output from the UI and serial threads, written by log_worker
+        # (bounded - the oldest lines are dropped if stdout falls far behind)
+        self._log_queue = deque(maxlen=1000)
+        self._log_event = threading.Event()
+        
+    def start_ui(self):
+        """Initialize pygame, open the window and build the font and glyph caches"""
+        # Pygame setup - use more screen space
+        pygame.init()
+        self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), pygame.DOUBLEBUF)
+        pygame.display.set_caption("🌡️ F150 CAN Bus Visual Monitor - ASCII/HEX Explorer")
+        self.clock = pygame.time.Clock()
+        
+        # Only queue the events handle_events acts on, so mouse motion floods never reach it
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEWHEEL,
+                                  pygame.WINDOWEXPOSED])
+        
+        # Fonts - bigger fonts for better readability, one Font object per size
+        self.get_font = functools.lru_cache(maxsize=8)(lambda size: pygame.font.Font(None, size))
+        self.small_font = self.get_font(16)
+        self.header_font = self.get_font(18)
+        self.info_font = self.get_font(16)
+        self.big_font = self.get_font(20)
+        
+        # Rendered text by (font, text, color) - panel headers, hints, legend and analysis
+        # lines repeat across frames, so only lines whose text changed get rasterized
+        self.render_text = functools.lru_cache(maxsize=256)(lambda font, text, color: font.render(text, True, color).convert_alpha())
+        
+        # Pre-rendered cell glyphs - only 256 possible values per display mode, all
+        # cached surfaces are converted to the display format once up front
+        self._hex_surfs = [self.small_font.render(_HEX_TBL[v], True, self.BLACK).convert_alpha() for v in range(256)]
+        self._ascii_surfs = [self.small_font.render(_ASCII_LUT[v], True, self.BLACK).convert_alpha() for v in range(256)]
+        self._active_glyphs = self._ascii_surfs if self.display_mode == "ASCII" else self._hex_surfs
+        self._pid_surfs = {}  # [pid] = rendered PID label, filled on first draw
+        self._cell_tiles = {}  # [(color, border_width)] = filled cell surface, see get_cell_tile
+        
+        # Static chrome, re-rendered only when scroll position, mode or PID count changes
+        # Matching the display pixel format keeps the full-window blit a plain copy
+        self._bg = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT)).convert()
+        self._bg_key = None
+        self._full_redraw = True
+    
     def connect(self):
         """Connect to serial port"""
         try:
-            self.serial = serial.Serial(self.port, self.baud_rate, timeout=0.1)
+            self.serial = serial.Serial(self.port, self.baud_rate, timeout=0.05)
+            
+            # Let the driver absorb CAN bursts while the UI thread holds the GIL (Windows only)
+            if hasattr(self.serial, 'set_buffer_size'):
+                self.serial.set_buffer_size(rx_size=1 << 16)
             print(f"✅ Connected to {self.port}")
             return True
         except Exception as e:
@@ -100,15 +226,15 @@ class CANVisualGrid:
             if len(self.selected_cells) >= 2:
                 pid1, byte1_idx = self.selected_cells[0]
                 pid2, byte2_idx = self.selected_cells[1]
-                byte0_val = self.current_values[pid1][byte1_idx]
-                byte1_val = self.current_values[pid2][byte2_idx]
+                byte0_val = self.get_byte_value(pid1, byte1_idx)
+                byte1_val = self.get_byte_value(pid2, byte2_idx)
                 combined = (byte0_val << 8) | byte1_val
                 
                 # This would need to be implemented with a proper input dialog
                 # For now, just show what we would do
-                print(f"🌡️ Current CAN value: {combined} - Use console input for actual temperature")
+                self.log(f"🌡️ Current CAN value: {combined} - Use console input for actual temperature")
         except Exception as e:
-            print(f"Error getting temperature input: {e}")
+            self.log(f"Error getting temperature input: {e}")
     
     def calculate_temperature_formula(self):
         """Calculate linear regression formula from calibration data"""
@@ -116,62 +242,49 @@ class CANVisualGrid:
             return
         
         # Extract x (CAN values) and y (temperatures)
-        x_vals = [point[1] for point in self.calibration_data]  # CAN values
-        y_vals = [point[0] for point in self.calibration_data]  # Actual temps
+        x_vals = np.fromiter((point[1] for point in self.calibration_data), dtype=np.float64)  # CAN values
+        y_vals = np.fromiter((point[0] for point in self.calibration_data), dtype=np.float64)  # Actual temps
         
-        # Simple linear regression: y = mx + b
-        n = len(self.calibration_data)
-        sum_x = sum(x_vals)
-        sum_y = sum(y_vals)
-        sum_xy = sum(x * y for x, y in zip(x_vals, y_vals))
-        sum_x2 = sum(x * x for x in x_vals)
+        # Least-squares linear fit: y = mx + b
+        m, b = np.polyfit(x_vals, y_vals, 1)
+        predicted_vals = m * x_vals + b
+        errors = np.abs(y_vals - predicted_vals)
         
-        # Calculate slope (m) and intercept (b)
-        m = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
-        b = (sum_y - m * sum_x) / n
-        
-        print(f"\n🧮 CALCULATED FORMULA:")
-        print(f"temperature_f = {m:.6f} * combined_value + {b:.2f}")
-        print(f"📐 Or: temperature_f = (combined_value * {m:.6f}) + {b:.2f}")
+        self.log(f"\n🧮 CALCULATED FORMULA:")
+        self.log(f"temperature_f = {m:.6f} * combined_value + {b:.2f}")
+        self.log(f"📐 Or: temperature_f = (combined_value * {m:.6f}) + {b:.2f}")
         
         # Test the formula with collected data
-        print(f"\n🧪 FORMULA TEST:")
-        print("Actual | Predicted | Error")
-        print("-" * 30)
-        for actual_temp, can_val, _ in self.calibration_data:
-            predicted = m * can_val + b
-            error = abs(actual_temp - predicted)
-            print(f"{actual_temp:6.1f} | {predicted:9.1f} | {error:5.1f}")
+        self.log(f"\n🧪 FORMULA TEST:")
+        self.log("Actual | Predicted | Error")
+        self.log("-" * 30)
+        for actual_temp, predicted, error in zip(y_vals, predicted_vals, errors):
+            self.log(f"{actual_temp:6.1f} | {predicted:9.1f} | {error:5.1f}")
         
         # Calculate average error
-        avg_error = sum(abs(temp - (m * can_val + b)) for temp, can_val, _ in self.calibration_data) / n
-        print(f"\n📊 Average error: {avg_error:.2f}°F")
+        avg_error = errors.mean()
+        self.log(f"\n📊 Average error: {avg_error:.2f}°F")
     
     def parse_can_message(self, line):
-        """Parse CAN message from CSV format"""
-        if line.startswith('#') or not line.strip():
+        """Parse CAN message from raw CSV bytes"""
+        if not line or line.startswith(b'#'):
+            return None
+        
+        # Logger lines always carry 8 byte columns, even for short DLCs
+        if line.count(b',') < 7:
             return None
         
         try:
-            parts = line.split(',')
-            if len(parts) < 8:
+            tokens = _HEX_RE.findall(line)
+            if not tokens:
                 return None
             
-            can_id = parts[2].strip()
-            if not can_id.startswith('0x'):
-                return None
+            can_id = int(tokens[0], 16)
             
-            # Parse all 8 bytes
-            byte_values = []
-            for i in range(8):
-                if 4 + i < len(parts):
-                    hex_val = parts[4 + i].strip()
-                    if hex_val and hex_val.startswith('0x'):
-                        byte_values.append(int(hex_val, 16))
-                    else:
-                        byte_values.append(0)
-                else:
-                    byte_values.append(0)
+            # Bytes beyond the DLC are empty columns, pad them with zeros
+            byte_values = bytes(map(_HEX_LUT.__getitem__, tokens[1:9]))
+            if len(byte_values) < 8:
+                byte_values = byte_values.ljust(8, b'\x00')
             
             return (can_id, byte_values)
             
@@ -180,117 +293,178 @@ class CANVisualGrid:
     
     def read_serial_data(self):
         """Read serial data in background thread"""
-        last_logged_combined = None
+        rx_buffer = bytearray()
         
         while self.running:
-            if self.serial and self.serial.in_waiting:
-                try:
-                    line = self.serial.readline().decode('utf-8', errors='ignore').strip()
-                    result = self.parse_can_message(line)
+            try:
+                # Block until data arrives (or the port timeout), then drain everything buffered
+                data = self.serial.read(max(1, self.serial.in_waiting))
+            except Exception:
+                time.sleep(0.05)
+                continue
+            
+            if not data:
+                continue
+            
+            rx_buffer += data
+            end = rx_buffer.rfind(b'\n')
+            if end < 0:
+                continue
+            
+            # Keep the partial trailing line for the next read
+            lines = rx_buffer[:end].split(b'\n')
+            del rx_buffer[:end + 1]
+            
+            # Lines go to the parser as raw bytes, a trailing '\r' is harmless to it
+            for count, line in enumerate(lines, 1):
+                self.process_can_line(line)
+                
+                # Let the UI thread in during large bursts
+                if count % 64 == 0:
+                    time.sleep(0)
+    
+    def process_can_line(self, line):
+        """Apply one raw logger line to the grid"""
+        try:
+            result = self.parse_can_message(line)
+            
+            if result:
+                can_id, byte_values = result
+                current_time = time.time()
+                
+                # Add new PID if not seen before
+                row = self.pid_row.get(can_id)
+                if row is None:
+                    row = self.add_pid(can_id)
+                
+                # Check for changes and update values - most frames repeat the last payload,
+                # which a single bytes compare rules out before touching the arrays
+                if byte_values != self._payloads[row]:
+                    self._payloads[row] = byte_values
+                    new_values = np.frombuffer(byte_values, dtype=np.uint8)
+                    changed = self.current_values[row] != new_values
+                    self.change_times[row, changed] = current_time
+                    self.current_values[row] = new_values
+                    self._seq += 1
+                    self._dirty_evt.set()
+                
+                # Log encoder values if we have 2 cells selected and values changed
+                if len(self.selected_cells) == 2:
+                    pid1, byte1_idx = self.selected_cells[0]
+                    pid2, byte2_idx = self.selected_cells[1]
                     
-                    if result:
-                        can_id, byte_values = result
-                        current_time = time.time()
-                        
-                        # Add new PID if not seen before
-                        if can_id not in self.pid_list:
-                            self.pid_list.append(can_id)
+                    # Check if this update is for our selected PID - its row is already known
+                    if can_id == pid1:
+                        byte0_val = int(self.current_values[row, byte1_idx])
+                        byte1_val = self.get_byte_value(pid2, byte2_idx)
+                        combined = (byte0_val << 8) | byte1_val
                         
-                        # Check for changes and update values
-                        old_values = self.current_values[can_id]
-                        for i, new_value in enumerate(byte_values):
-                            if old_values[i] != new_value:
-                                self.change_times[can_id][i] = current_time
-                            self.current_values[can_id][i] = new_value
-                        
-                        # Log encoder values if we have 2 cells selected and values changed
-                        if len(self.selected_cells) == 2:
-                            pid1, byte1_idx = self.selected_cells[0]
-                            pid2, byte2_idx = self.selected_cells[1]
+                        # Only log if combined value changed
+                        if self._last_logged_combined != combined:
+                            ascii0 = _ASCII_LUT[byte0_val]
+                            ascii1 = _ASCII_LUT[byte1_val]
                             
-                            # Check if this update is for our selected PID
-                            if can_id == pid1:
-                                byte0_val = self.current_values[pid1][byte1_idx]
-                                byte1_val = self.current_values[pid2][byte2_idx]
-                                combined = (byte0_val << 8) | byte1_val
-                                
-                                # Only log if combined value changed
-                                if last_logged_combined != combined:
-                                    ascii0 = self.byte_to_ascii_display(byte0_val)
-                                    ascii1 = self.byte_to_ascii_display(byte1_val)
-                                    
-                                    # Standard logging
-                                    print(f"LOG: 0x{byte0_val:02X}({ascii0}) | 0x{byte1_val:02X}({ascii1}) | {combined:5d} | ASCII: '{ascii0}{ascii1}'")
-                                    
-                                    # Calibration mode: prompt for actual temperature
-                                    if self.calibration_mode:
-                                        print(f"🌡️ CALIBRATION: CAN value = {combined} | Enter actual LCD temperature (or press Enter to skip): ", end='', flush=True)
-                                    
-                                    last_logged_combined = combined
-                        
-                        self.total_messages += 1
+                            # Standard logging
+                            self.log(f"LOG: {_HEX0X_TBL[byte0_val]}({ascii0}) | {_HEX0X_TBL[byte1_val]}({ascii1}) | {combined:5d} | ASCII: '{ascii0}{ascii1}'")
+                            
+                            # Calibration mode: prompt for actual temperature
+                            if self.calibration_mode:
+                                self.log(f"🌡️ CALIBRATION: CAN value = {combined} | Enter actual LCD temperature (or press Enter to skip): ", end='')
+                            
+                            self._last_logged_combined = combined
                 
-                except Exception as e:
-                    pass
-            
-            time.sleep(0.001)  # Very fast polling
+                self.total_messages += 1
+        
+        except Exception as e:
+            pass
+    
+    def log(self, message="", end="\n"):
+        """Queue a console message instead of blocking the calling thread on stdout"""
+        self._log_queue.append(message + end)
+        self._log_event.set()
+    
+    def flush_log(self):
+        """Write all queued console messages to stdout"""
+        try:
+            while True:
+                sys.stdout.write(self._log_queue.popleft())
+        except IndexError:
+            pass
+        sys.stdout.flush()
+    
+    def log_worker(self):
+        """Drain queued console messages in background thread"""
+        while True:
+            self._log_event.wait()
+            self._log_event.clear()
+            self.flush_log()
+    
+    def add_pid(self, can_id):
+        """Assign the next row to a new PID, doubling array capacity when full"""
+        row = len(self.pid_list)
+        if row >= len(self.current_values):
+            # Swap in the grown arrays before publishing the row to the draw loop
+            self.current_values = np.vstack((self.current_values, np.zeros_like(self.current_values)))
+            self.change_times = np.vstack((self.change_times, np.zeros_like(self.change_times)))
+        self.pid_row[can_id] = row
+        self._payloads.append(bytes(8))
+        self._pid_label[can_id] = f"0x{can_id:X}"
+        self.pid_list.append(can_id)
+        self._full_redraw = True
+        return row
+    
+    def get_byte_value(self, pid, byte_index):
+        """Get the current value of one byte as a plain int"""
+        return int(self.current_values[self.pid_row[pid], byte_index])
     
     def byte_to_ascii_display(self, byte_value):
-        """Convert byte to ASCII character if printable, otherwise show as '.'"""
-        if 32 <= byte_value <= 126:  # Printable ASCII range
-            return chr(byte_value)
-        else:
-            return '.'
+        """Convert byte to ASCII character if printable, otherwise show as '.' (kept for external callers)"""
+        return _ASCII_LUT[byte_value]
     
     def is_printable_ascii(self, byte_value):
         """Check if byte value is printable ASCII"""
         return 32 <= byte_value <= 126
     
-    def get_cell_color(self, pid, byte_index):
-        """Get color for a cell based on selection, ASCII content, and recent changes"""
-        # Check if this cell is selected
-        cell = (pid, byte_index)
-        if cell in self.selected_cells:
-            if len(self.selected_cells) == 1:
-                return self.ORANGE
-            else:
-                # Different colors for first and second selection
-                if self.selected_cells.index(cell) == 0:
-                    return self.PURPLE
-                else:
-                    return self.CYAN
-        
-        # Highlight ASCII-printable values in ASCII mode
-        if self.display_mode == "ASCII":
-            byte_value = self.current_values[pid][byte_index]
-            if self.is_printable_ascii(byte_value):
-                # Light green background for printable ASCII
-                change_time = self.change_times[pid][byte_index]
-                if change_time > 0 and time.time() - change_time < 2.0:
-                    return self.BRIGHT_GREEN  # Recent change takes priority
-                else:
-                    return self.LIGHT_GREEN
-        
-        change_time = self.change_times[pid][byte_index]
-        if change_time == 0:
-            return self.WHITE
-        
-        age = time.time() - change_time
-        
-        if age < 0.5:  # Bright green for very recent changes
-            return self.BRIGHT_GREEN
-        elif age < 1.0:  # Green for recent changes
-            return self.GREEN
-        elif age < 2.0:  # Yellow for somewhat recent
-            return self.YELLOW
-        elif age < 5.0:  # Fading back to white
-            fade = (age - 2.0) / 3.0  # 0 to 1 over 3 seconds
-            r = int(255 * fade + 255 * (1 - fade))
-            g = int(255 * fade + 255 * (1 - fade))
-            b = int(255 * fade + 0 * (1 - fade))
-            return (r, g, b)
+    def get_window_colors(self, start_row, end_row, now):
+        """Get a (rows, 8, 3) array of cell colors at once, rules as in _fill_window_colors plus selection"""
+        change_times = self.change_times[start_row:end_row]
+        values = self.current_values[start_row:end_row]
+        colors = np.empty(change_times.shape + (3,), dtype=np.uint8)
+        
+        if njit is not None:
+            # Compiled single pass over the window
+            _fill_window_colors(change_times, values, now, self.display_mode == "ASCII",
+                                self._band_palette, self._fade_palette, colors)
         else:
-            return self.WHITE
+            # NumPy fallback - the same rules as _fill_window_colors, cell by cell
+            ages = now - change_times
+            never = change_times == 0
+            
+            # Age band and fade step per cell, then two table lookups
+            bands = np.searchsorted(_AGE_BANDS, ages, side='right')
+            bands[never] = len(_AGE_BANDS)
+            fade_steps = np.clip(((ages - 2.0) * (_FADE_STEPS / 3.0)).astype(np.intp), 0, _FADE_STEPS - 1)
+            colors[...] = np.where((bands == _FADE_BAND)[..., None],
+                                   self._fade_palette[fade_steps], self._band_palette[bands])
+            
+            # Printable ASCII overrides the age colors in ASCII mode
+            if self.display_mode == "ASCII":
+                printable = (values >= 32) & (values <= 126)
+                recent = ~never & (ages < 2.0)
+                colors[printable] = self.LIGHT_GREEN
+                colors[printable & recent] = self.BRIGHT_GREEN
+        
+        # Selected cells win over everything else
+        for i, (pid, byte_index) in enumerate(self.selected_cells):
+            row = self.pid_row[pid]
+            if start_row <= row < end_row:
+                if len(self.selected_cells) == 1:
+                    color = self.ORANGE
+                else:
+                    color = self.PURPLE if i == 0 else self.CYAN
+                colors[row - start_row, byte_index] = color
+        
+        return colors
     
     def get_cell_at_position(self, mouse_x, mouse_y):
         """Get the PID and byte index for a cell at mouse position"""
@@ -322,8 +496,8 @@ class CANVisualGrid:
         
         if value2 is None:
             # Single byte analysis
-            ascii_char = self.byte_to_ascii_display(value1)
-            results.append((f"ASCII: '{ascii_char}' (0x{value1:02X})", 0, 0, False))
+            ascii_char = _ASCII_LUT[value1]
+            results.append((f"ASCII: '{ascii_char}' ({_HEX0X_TBL[value1]})", 0, 0, False))
             
             # Traditional temperature guesses
             for offset in [0, 40, 50]:
@@ -336,12 +510,12 @@ class CANVisualGrid:
             byte0 = value1
             byte1 = value2
             
-            ascii0 = self.byte_to_ascii_display(byte0)
-            ascii1 = self.byte_to_ascii_display(byte1)
+            ascii0 = _ASCII_LUT[byte0]
+            ascii1 = _ASCII_LUT[byte1]
             ascii_string = f"{ascii0}{ascii1}"
             
             # Show ASCII interpretation first
-            results.append((f"ASCII: '{ascii_string}' (0x{byte0:02X} 0x{byte1:02X})", 0, 0, True))
+            results.append((f"ASCII: '{ascii_string}' ({_HEX0X_TBL[byte0]} {_HEX0X_TBL[byte1]})", 0, 0, True))
             
             # Check if it's Ford's HVAC ASCII encoding (digits)
             if ascii0.isdigit() and ascii1.isdigit():
@@ -384,14 +558,13 @@ class CANVisualGrid:
         
         return results
     
-    def draw_info_panel(self):
-        """Draw the enhanced information panel at the bottom"""
+    def draw_info_panel(self, now, force=False):
+        """Draw the enhanced information panel at the bottom, returns the area painted or None if unchanged"""
         panel_y = self.WINDOW_HEIGHT - self.info_panel_height
         panel_rect = pygame.Rect(0, panel_y, self.WINDOW_WIDTH, self.info_panel_height)
         
-        # Panel background
-        pygame.draw.rect(self.screen, self.DARK_GRAY, panel_rect)
-        pygame.draw.rect(self.screen, self.WHITE, panel_rect, 2)
+        # Collect the panel text first so an unchanged panel can be skipped
+        lines = []  # (surface, position) pairs
         
         if len(self.selected_cells) > 0:
             # Display information for selected cells
@@ -403,79 +576,90 @@ class CANVisualGrid:
             else:
                 header = "📍 Two Cells Selected - Ford ASCII Decoding"
             
-            text = self.big_font.render(header, True, self.WHITE)
-            self.screen.blit(text, (10, panel_y + y_offset))
+            text = self.render_text(self.big_font, header, self.WHITE)
+            lines.append((text, (10, panel_y + y_offset)))
             y_offset += 25
             
             # Cell details with ASCII
             for i, (pid, byte_index) in enumerate(self.selected_cells):
-                value = self.current_values[pid][byte_index]
-                ascii_char = self.byte_to_ascii_display(value)
-                change_time = self.change_times[pid][byte_index]
+                value = self.get_byte_value(pid, byte_index)
+                ascii_char = _ASCII_LUT[value]
+                change_time = self.change_times[self.pid_row[pid], byte_index]
                 
-                time_str = f"{time.time() - change_time:.1f}s ago" if change_time > 0 else "Never"
+                time_str = f"{now - change_time:.1f}s ago" if change_time > 0 else "Never"
                 color_name = "PURPLE" if i == 0 else "CYAN"
                 
-                cell_info = f"Cell {i+1} ({color_name}): PID {pid}, Byte {byte_index} = 0x{value:02X} ('{ascii_char}') | Changed: {time_str}"
-                text = self.info_font.render(cell_info, True, self.WHITE)
-                self.screen.blit(text, (10, panel_y + y_offset))
+                cell_info = f"Cell {i+1} ({color_name}): PID {self._pid_label[pid]}, Byte {byte_index} = {_HEX0X_TBL[value]} ('{ascii_char}') | Changed: {time_str}"
+                text = self.render_text(self.info_font, cell_info, self.WHITE)
+                lines.append((text, (10, panel_y + y_offset)))
                 y_offset += 18
             
             # ASCII/Temperature analysis
             if len(self.selected_cells) == 1:
-                value1 = self.current_values[self.selected_cells[0][0]][self.selected_cells[0][1]]
+                value1 = self.get_byte_value(*self.selected_cells[0])
                 results = self.calculate_temperature_values(value1)
                 
                 for calc, temp_c, temp_f, is_primary in results[:3]:  # Show first 3
                     color = self.GREEN if is_primary else self.YELLOW
-                    text = self.small_font.render(calc, True, color)
-                    self.screen.blit(text, (10, panel_y + y_offset))
+                    text = self.render_text(self.small_font, calc, color)
+                    lines.append((text, (10, panel_y + y_offset)))
                     y_offset += 16
                 
             else:
-                value1 = self.current_values[self.selected_cells[0][0]][self.selected_cells[0][1]]
-                value2 = self.current_values[self.selected_cells[1][0]][self.selected_cells[1][1]]
+                value1 = self.get_byte_value(*self.selected_cells[0])
+                value2 = self.get_byte_value(*self.selected_cells[1])
                 results = self.calculate_temperature_values(value1, value2)
                 
                 # Show results with color coding
                 for calc, temp_c, temp_f, is_primary in results[:4]:  # Show first 4
                     color = self.GREEN if is_primary else self.GRAY
                     font = self.info_font if is_primary else self.small_font
-                    text = font.render(calc, True, color)
-                    self.screen.blit(text, (10, panel_y + y_offset))
+                    text = self.render_text(font, calc, color)
+                    lines.append((text, (10, panel_y + y_offset)))
                     y_offset += 18 if is_primary else 14
             
         else:
             # Default message
             cal_status = "CALIBRATION ON" if self.calibration_mode else "OFF"
-            lines = [
+            hints = [
                 f"🖱️ ASCII/HEX EXPLORER - Mode: {self.display_mode} | Calibration: {cal_status}",
                 "Press 'A' = ASCII/HEX toggle | 'T' = Temperature calibration mode",
                 "🌡️ CALIBRATION: Select temp sensor cells, press T, then input LCD readings",
                 "🔤 ASCII mode highlights Ford's text-based encoding schemes"
             ]
             
-            for i, line in enumerate(lines):
-                text = self.info_font.render(line, True, self.WHITE)
-                self.screen.blit(text, (10, panel_y + 10 + i * 18))
-    
-    def draw_grid(self):
-        """Draw the main grid"""
-        self.screen.fill(self.BLACK)
+            for i, line in enumerate(hints):
+                text = self.render_text(self.info_font, line, self.WHITE)
+                lines.append((text, (10, panel_y + 10 + i * 18)))
         
-        # Draw title and stats
-        title_text = self.header_font.render(f"🌡️ F150 CAN Bus ASCII/HEX Explorer - Mode: {self.display_mode}", True, self.WHITE)
-        self.screen.blit(title_text, (10, 5))
+        if not force and lines == self._panel_lines:
+            return None
+        self._panel_lines = lines
         
-        # Calculate messages per second
-        current_time = time.time()
-        if current_time - self.last_fps_time >= 1.0:
-            self.messages_per_second = self.total_messages - self.last_message_count
-            self.last_message_count = self.total_messages
-            self.last_fps_time = current_time
+        # Panel background
+        pygame.draw.rect(self.screen, self.DARK_GRAY, panel_rect)
+        pygame.draw.rect(self.screen, self.WHITE, panel_rect, 2)
+        self.screen.blits(lines)
         
-        stats_text = self.small_font.render(f"PIDs: {len(self.pid_list)} | Messages: {self.total_messages} | Rate: {self.messages_per_second}/s | Selected: {len(self.selected_cells)}/2", True, self.WHITE)
-        self.screen.blit(stats_text, (10, 25))
+        return panel_rect
+    
+    def get_cell_tile(self, color, border_width):
+        """Get a pre-filled surface for the inside of a cell with the given border width"""
+        tile = self._cell_tiles.get((color, border_width))
+        if tile is None:
+            tile = pygame.Surface((self.CELL_WIDTH - 2 * border_width, self.CELL_HEIGHT - 2 * border_width)).convert()
+            tile.fill(color)
+            self._cell_tiles[(color, border_width)] = tile
+        return tile
+    
+    def render_background(self, pid_count):
+        """Pre-render the static chrome: title, column headers, PID labels, scrollbar and legend"""
+        bg = self._bg
+        bg.fill(self.BLACK)
+        
+        # Draw title
+        title_text = self.render_text(self.header_font, f"🌡️ F150 CAN Bus ASCII/HEX Explorer - Mode: {self.display_mode}", self.WHITE)
+        bg.blit(title_text, (10, 5))
         
         # Draw column headers (Byte 0-7)
         for col in range(8):
@@ -483,76 +667,43 @@ class CANVisualGrid:
             y = self.START_Y - 30
             
             # Header background
-            pygame.draw.rect(self.screen, self.DARK_GRAY, (x, y, self.CELL_WIDTH, 25))
-            pygame.draw.rect(self.screen, self.WHITE, (x, y, self.CELL_WIDTH, 25), 1)
+            pygame.draw.rect(bg, self.DARK_GRAY, (x, y, self.CELL_WIDTH, 25))
+            pygame.draw.rect(bg, self.WHITE, (x, y, self.CELL_WIDTH, 25), 1)
             
             # Header text
-            header_text = self.small_font.render(f"Byte {col}", True, self.WHITE)
+            header_text = self.render_text(self.small_font, f"Byte {col}", self.WHITE)
             text_rect = header_text.get_rect(center=(x + self.CELL_WIDTH//2, y + 12))
-            self.screen.blit(header_text, text_rect)
+            bg.blit(header_text, text_rect)
         
-        # Calculate which PIDs to show (handle scrolling)
+        # Draw PID labels for the visible rows
         start_row = self.scroll_offset
-        end_row = min(start_row + self.max_visible_rows, len(self.pid_list))
-        
-        # Draw grid rows
+        end_row = min(start_row + self.max_visible_rows, pid_count)
         for row_idx, pid_idx in enumerate(range(start_row, end_row)):
-            if pid_idx >= len(self.pid_list):
-                break
-                
             pid = self.pid_list[pid_idx]
             y = self.START_Y + row_idx * self.CELL_HEIGHT
             
-            # Draw PID label
             pid_rect = pygame.Rect(5, y, self.PID_COLUMN_WIDTH - 10, self.CELL_HEIGHT)
-            pygame.draw.rect(self.screen, self.BLUE, pid_rect)
-            pygame.draw.rect(self.screen, self.WHITE, pid_rect, 1)
+            pygame.draw.rect(bg, self.BLUE, pid_rect)
+            pygame.draw.rect(bg, self.WHITE, pid_rect, 1)
             
-            pid_text = self.small_font.render(pid, True, self.WHITE)
+            pid_text = self._pid_surfs.get(pid)
+            if pid_text is None:
+                pid_text = self._pid_surfs[pid] = self.small_font.render(self._pid_label[pid], True, self.WHITE).convert_alpha()
             text_rect = pid_text.get_rect(center=pid_rect.center)
-            self.screen.blit(pid_text, text_rect)
-            
-            # Draw data cells for each byte
-            for col in range(8):
-                x = self.START_X + col * self.CELL_WIDTH
-                cell_rect = pygame.Rect(x, y, self.CELL_WIDTH, self.CELL_HEIGHT)
-                
-                # Get cell color based on mode, ASCII content, and changes
-                cell_color = self.get_cell_color(pid, col)
-                
-                # Draw cell
-                pygame.draw.rect(self.screen, cell_color, cell_rect)
-                
-                # Draw thicker border for selected cells
-                cell = (pid, col)
-                border_width = 3 if cell in self.selected_cells else 1
-                pygame.draw.rect(self.screen, self.BLACK, cell_rect, border_width)
-                
-                # Draw value based on display mode
-                value = self.current_values[pid][col]
-                
-                if self.display_mode == "HEX":
-                    display_text = f"{value:02X}"
-                else:  # ASCII mode
-                    ascii_char = self.byte_to_ascii_display(value)
-                    display_text = ascii_char
-                
-                value_text = self.small_font.render(display_text, True, self.BLACK)
-                text_rect = value_text.get_rect(center=cell_rect.center)
-                self.screen.blit(value_text, text_rect)
+            bg.blit(pid_text, text_rect)
         
         # Draw scrollbar if needed
-        if len(self.pid_list) > self.max_visible_rows:
+        if pid_count > self.max_visible_rows:
             scrollbar_x = self.WINDOW_WIDTH - 20
             scrollbar_height = self.WINDOW_HEIGHT - self.START_Y - self.info_panel_height - 10
             
             # Scrollbar background
-            pygame.draw.rect(self.screen, self.DARK_GRAY, (scrollbar_x, self.START_Y, 15, scrollbar_height))
+            pygame.draw.rect(bg, self.DARK_GRAY, (scrollbar_x, self.START_Y, 15, scrollbar_height))
             
             # Scrollbar thumb
-            thumb_height = max(20, (self.max_visible_rows / len(self.pid_list)) * scrollbar_height)
-            thumb_y = self.START_Y + (self.scroll_offset / len(self.pid_list)) * scrollbar_height
-            pygame.draw.rect(self.screen, self.GRAY, (scrollbar_x, thumb_y, 15, thumb_height))
+            thumb_height = max(20, (self.max_visible_rows / pid_count) * scrollbar_height)
+            thumb_y = self.START_Y + (self.scroll_offset / pid_count) * scrollbar_height
+            pygame.draw.rect(bg, self.GRAY, (scrollbar_x, thumb_y, 15, thumb_height))
         
         # Draw display mode legend
         legend_x = self.WINDOW_WIDTH - 250
@@ -567,16 +718,125 @@ class CANVisualGrid:
         
         for i, (label, color) in enumerate(legend_items):
             y = legend_y + i * 20
-            pygame.draw.rect(self.screen, color, (legend_x, y, 15, 15))
-            text = self.small_font.render(label, True, self.WHITE)
-            self.screen.blit(text, (legend_x + 20, y))
+            pygame.draw.rect(bg, color, (legend_x, y, 15, 15))
+            text = self.render_text(self.small_font, label, self.WHITE)
+            bg.blit(text, (legend_x + 20, y))
         
         # Draw mode toggle hint
-        toggle_text = self.small_font.render("Press 'A' to toggle ASCII/HEX", True, self.YELLOW)
-        self.screen.blit(toggle_text, (legend_x, legend_y + 100))
+        toggle_text = self.render_text(self.small_font, "Press 'A' to toggle ASCII/HEX", self.YELLOW)
+        bg.blit(toggle_text, (legend_x, legend_y + 100))
+        
+        self._bg_key = (self.scroll_offset, self.display_mode, pid_count)
+    
+    def draw_stats(self):
+        """Draw the stats line over the background header band, returns the area painted"""
+        header_rect = pygame.Rect(0, 0, self.WINDOW_WIDTH, self.START_Y)
+        self.screen.blit(self._bg, header_rect, header_rect)
+        
+        # Not cached - draw_grid only calls this when one of the numbers changed
+        stats_text = self.small_font.render(f"PIDs: {len(self.pid_list)} | Messages: {self.total_messages} | Rate: {self.messages_per_second}/s | Selected: {len(self.selected_cells)}/2", True, self.WHITE)
+        self.screen.blit(stats_text, (10, 25))
+        
+        # Column headers sit on top of the stats line
+        headers_rect = pygame.Rect(self.START_X, self.START_Y - 30, 8 * self.CELL_WIDTH, 25)
+        self.screen.blit(self._bg, headers_rect, headers_rect)
+        
+        return header_rect
+    
+    def draw_grid(self):
+        """Draw the main grid, returns the list of screen rects that were repainted"""
+        # Take the flags before the snapshot below - a PID added or a change stored after
+        # this point sets them again, so it is picked up next frame instead of being lost
+        full_redraw = self._full_redraw
+        self._full_redraw = False
+        self._dirty_evt.clear()
+        
+        # One timestamp, PID count and store sequence for the whole frame
+        now = time.time()
+        pid_count = len(self.pid_list)
+        seq = self._seq
+        self._last_draw_time = now
+        
+        # Calculate messages per second
+        if now - self.last_fps_time >= 1.0:
+            self.messages_per_second = self.total_messages - self.last_message_count
+            self.last_message_count = self.total_messages
+            self.last_fps_time = now
+        
+        dirty_rects = []
+        if full_redraw:
+            if self._bg_key != (self.scroll_offset, self.display_mode, pid_count):
+                self.render_background(pid_count)
+            self.screen.blit(self._bg, (0, 0))
+            dirty_rects.append(self.screen.get_rect())
+        
+        # Stats line only needs repainting when one of its numbers moved
+        stats = (pid_count, self.total_messages, self.messages_per_second, len(self.selected_cells))
+        if full_redraw or stats != self._last_stats:
+            self._last_stats = stats
+            dirty_rects.append(self.draw_stats())
         
-        # Draw info panel
-        self.draw_info_panel()
+        # Calculate which PIDs to show (handle scrolling)
+        start_row = self.scroll_offset
+        end_row = min(start_row + self.max_visible_rows, pid_count)
+        visible_rows = max(0, end_row - start_row)
+        
+        # Colors for the whole visible window in one pass, values only need
+        # a fresh copy when the serial thread stored something since last frame
+        window_colors = self.get_window_colors(start_row, end_row, now)
+        values_moved = full_redraw or seq != self._drawn_seq
+        if values_moved:
+            window_values = self.current_values[start_row:end_row].copy()
+            self._drawn_seq = seq
+        else:
+            window_values = self._painted_values[:visible_rows]
+        
+        # Only cells whose color or value differs from what is on screen get repainted,
+        # this also catches cells crossing into the next age color
+        if full_redraw:
+            changed = np.ones((visible_rows, 8), dtype=bool)
+        else:
+            changed = (window_colors != self._painted_colors[:visible_rows]).any(axis=2)
+            if values_moved:
+                changed |= window_values != self._painted_values[:visible_rows]
+        self._painted_colors[:visible_rows] = window_colors
+        if values_moved:
+            self._painted_values[:visible_rows] = window_values
+        
+        # Draw data cells that changed - the black grid lines come from the background
+        changed_rows, changed_cols = np.nonzero(changed)
+        if len(changed_rows):
+            colors = window_colors.tolist()
+            values = window_values.tolist()
+            glyphs = self._active_glyphs  # swapped by the 'A' key, no mode check per frame
+            fills = []   # (tile, position) pairs
+            labels = []  # (glyph, rect) pairs
+            for row_idx, col in zip(changed_rows.tolist(), changed_cols.tolist()):
+                pid = self.pid_list[start_row + row_idx]
+                cell_rect = self._cell_rects[row_idx][col]
+                
+                # Fill inside the border, thicker border for selected cells
+                border_width = 3 if (pid, col) in self.selected_cells else 1
+                fills.append((self.get_cell_tile(tuple(colors[row_idx][col]), border_width),
+                              (cell_rect.x + border_width, cell_rect.y + border_width)))
+                
+                # Draw value based on display mode
+                value_text = glyphs[values[row_idx][col]]
+                labels.append((value_text, value_text.get_rect(center=cell_rect.center)))
+                
+                if not full_redraw:
+                    dirty_rects.append(cell_rect)
+            
+            # Labels sit inside their own cell, so all fills can go first in one batch
+            self.screen.blits(fills + labels, doreturn=False)
+        
+        # Draw info panel - selected cells show live values and ages
+        if full_redraw or self.selected_cells:
+            panel_rect = self.draw_info_panel(now, force=full_redraw)
+            if panel_rect:
+                dirty_rects.append(panel_rect)
+        
+        return dirty_rects
     
     def handle_events(self):
         """Handle pygame events"""
@@ -584,28 +844,35 @@ class CANVisualGrid:
             if event.type == pygame.QUIT:
                 return False
             
+            elif event.type == pygame.WINDOWEXPOSED:
+                # Frames only push changed rects, so an uncovered window needs a full repaint
+                self._full_redraw = True
+            
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     return False
                 elif event.key == pygame.K_a:
                     # Toggle ASCII/HEX display mode
                     self.display_mode = "ASCII" if self.display_mode == "HEX" else "HEX"
-                    print(f"🔄 Display mode: {self.display_mode}")
+                    self._active_glyphs = self._ascii_surfs if self.display_mode == "ASCII" else self._hex_surfs
+                    self._full_redraw = True
+                    self.log(f"🔄 Display mode: {self.display_mode}")
                 elif event.key == pygame.K_t:
                     # Toggle temperature calibration mode
                     self.calibration_mode = not self.calibration_mode
+                    self._full_redraw = True
                     if self.calibration_mode:
-                        print("🌡️ TEMPERATURE CALIBRATION MODE ON")
-                        print("📝 When CAN values change, you'll be prompted to enter actual LCD temperature")
-                        print("💡 Select your temperature sensor bytes first, then press T to start calibration")
+                        self.log("🌡️ TEMPERATURE CALIBRATION MODE ON")
+                        self.log("📝 When CAN values change, you'll be prompted to enter actual LCD temperature")
+                        self.log("💡 Select your temperature sensor bytes first, then press T to start calibration")
                     else:
-                        print("🌡️ TEMPERATURE CALIBRATION MODE OFF")
+                        self.log("🌡️ TEMPERATURE CALIBRATION MODE OFF")
                         if self.calibration_data:
-                            print(f"\n📊 CALIBRATION DATA COLLECTED ({len(self.calibration_data)} points):")
-                            print("Actual_Temp | CAN_Value | Notes")
-                            print("-" * 40)
+                            self.log(f"\n📊 CALIBRATION DATA COLLECTED ({len(self.calibration_data)} points):")
+                            self.log("Actual_Temp | CAN_Value | Notes")
+                            self.log("-" * 40)
                             for temp, can_val, timestamp in self.calibration_data:
-                                print(f"{temp:8.1f}°F | {can_val:8d} | {timestamp}")
+                                self.log(f"{temp:8.1f}°F | {can_val:8d} | {timestamp}")
                             
                             # Calculate linear regression if we have enough points
                             if len(self.calibration_data) >= 2:
@@ -619,13 +886,16 @@ class CANVisualGrid:
                     pass
                 elif event.key == pygame.K_UP:
                     self.scroll_offset = max(0, self.scroll_offset - 1)
+                    self._full_redraw = True
                 elif event.key == pygame.K_DOWN:
                     max_offset = max(0, len(self.pid_list) - self.max_visible_rows)
                     self.scroll_offset = min(max_offset, self.scroll_offset + 1)
+                    self._full_redraw = True
                 elif event.key == pygame.K_c:
                     # Clear selection
-                    self.selected_cells = []
-                    print("🗑️ Selection cleared")
+                    self.selected_cells.clear()
+                    self._full_redraw = True
+                    self.log("🗑️ Selection cleared")
             
             elif event.type == pygame.MOUSEWHEEL:
                 if event.y > 0:  # Scroll up
@@ -633,40 +903,32 @@ class CANVisualGrid:
                 else:  # Scroll down
                     max_offset = max(0, len(self.pid_list) - self.max_visible_rows)
                     self.scroll_offset = min(max_offset, self.scroll_offset + 3)
+                self._full_redraw = True
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    cell = self.get_cell_at_position(mouse_x, mouse_y)
+                    cell = self.get_cell_at_position(*event.pos)
                     if cell:
+                        self._full_redraw = True
                         if cell in self.selected_cells:
                             # Deselect if already selected
                             self.selected_cells.remove(cell)
-                            print(f"🚫 Deselected: PID {cell[0]}, Byte {cell[1]}")
+                            self.log(f"🚫 Deselected: PID {self._pid_label[cell[0]]}, Byte {cell[1]}")
                         else:
-                            # Add to selection (max 2)
-                            if len(self.selected_cells) < 2:
-                                self.selected_cells.append(cell)
-                                pid, byte_index = cell
-                                value = self.current_values[pid][byte_index]
-                                ascii_char = self.byte_to_ascii_display(value)
-                                print(f"✅ Selected {len(self.selected_cells)}/2: PID {pid}, Byte {byte_index}, Value: 0x{value:02X} ('{ascii_char}')")
-                                
-                                # If we now have 2 cells selected, start logging mode
-                                if len(self.selected_cells) == 2:
-                                    print("\n🔬 ASCII/HEX LOGGING MODE ACTIVATED!")
-                                    print("📝 Adjust controls and watch for ASCII patterns:")
-                                    print("HEX      ASCII    | HEX      ASCII    | Combined | ASCII String")
-                                    print("-" * 70)
-                                    
-                            else:
-                                # Replace oldest selection
-                                old_cell = self.selected_cells.pop(0)
-                                self.selected_cells.append(cell)
-                                pid, byte_index = cell
-                                value = self.current_values[pid][byte_index]
-                                ascii_char = self.byte_to_ascii_display(value)
-                                print(f"🔄 Replaced selection: PID {pid}, Byte {byte_index}, Value: 0x{value:02X} ('{ascii_char}')")
+                            # Add to selection - with 2 already selected the oldest drops out
+                            was_full = len(self.selected_cells) == 2
+                            self.selected_cells.append(cell)
+                            pid, byte_index = cell
+                            value = self.get_byte_value(pid, byte_index)
+                            verb = "🔄 Replaced selection" if was_full else f"✅ Selected {len(self.selected_cells)}/2"
+                            self.log(f"{verb}: PID {self._pid_label[pid]}, Byte {byte_index}, Value: {_HEX0X_TBL[value]} ('{_ASCII_LUT[value]}')")
+                            
+                            # If we now have 2 cells selected, start logging mode
+                            if not was_full and len(self.selected_cells) == 2:
+                                self.log("\n🔬 ASCII/HEX LOGGING MODE ACTIVATED!")
+                                self.log("📝 Adjust controls and watch for ASCII patterns:")
+                                self.log("HEX      ASCII    | HEX      ASCII    | Combined | ASCII String")
+                                self.log("-" * 70)
         
         return True
     
@@ -687,23 +949,31 @@ class CANVisualGrid:
         print("3. When values change, manually input actual LCD temperature")
         print("4. Press 'T' again to exit and see calculated formula")
         
+        self.start_ui()
         self.running = True
         
-        # Start serial reading thread
+        # Start console and serial reading threads
+        log_thread = threading.Thread(target=self.log_worker, daemon=True)
+        log_thread.start()
         serial_thread = threading.Thread(target=self.read_serial_data, daemon=True)
         serial_thread.start()
         
         # Main display loop
-        clock = pygame.time.Clock()
-        
         try:
             while self.running:
                 if not self.handle_events():
                     break
                 
-                self.draw_grid()
-                pygame.display.flip()
-                clock.tick(30)  # 30 FPS
+                # Skip the frame when nothing changed, but keep a 4 Hz heartbeat
+                # so color fades, change ages and the message rate keep moving
+                if self._full_redraw or self._dirty_evt.is_set() or time.time() - self._last_draw_time >= 0.25:
+                    dirty_rects = self.draw_grid()
+                    if dirty_rects:
+                        pygame.display.update(dirty_rects)
+                    self.clock.tick(30)  # 30 FPS ceiling on redraws
+                else:
+                    # Idle bus - sleep until new data arrives, waking often enough to pump events
+                    self._dirty_evt.wait(timeout=1 / 30)
         
         except KeyboardInterrupt:
             pass
@@ -713,6 +983,7 @@ class CANVisualGrid:
             if self.serial:
                 self.serial.close()
             pygame.quit()
+            self.flush_log()
             
             # Print final summary
             print("\n🎯 ASCII/HEX Explorer Session Complete!")